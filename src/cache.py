@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_CACHE_DIR = Path.home() / ".cache" / "cover-letter-generator"
+
+_LOCK = threading.Lock()
+_CONN: Optional[sqlite3.Connection] = None
+
+
+# Settings are read on use, not at import, so values that llm loads from .env still apply
+def _cache_dir() -> Path:
+	return Path(os.getenv("COVER_LETTER_CACHE_DIR") or _DEFAULT_CACHE_DIR)
+
+
+def _reads_enabled() -> bool:
+	# COVER_LETTER_NO_CACHE=1 skips lookups; fresh results are still stored
+	return os.getenv("COVER_LETTER_NO_CACHE") != "1"
+
+
+def _text_path(namespace: str, key: str) -> Path:
+	return _cache_dir() / namespace / f"{key}.txt"
+
+
+def read_text(namespace: str, key: str) -> Optional[str]:
+	try:
+		return _text_path(namespace, key).read_text(encoding="utf-8")
+	except FileNotFoundError:
+		return None
+	except OSError as e:
+		logger.error(f"Failed to read cached text {namespace}/{key}: {e}")
+		return None
+
+
+def write_text(namespace: str, key: str, text: str) -> None:
+	path = _text_path(namespace, key)
+	tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+	try:
+		path.parent.mkdir(parents=True, exist_ok=True)
+		tmp_path.write_text(text, encoding="utf-8")
+		os.replace(tmp_path, path)
+	except OSError as e:
+		logger.error(f"Failed to write cached text {namespace}/{key}: {e}")
+		tmp_path.unlink(missing_ok=True)
+
+
+def make_key(*parts: str) -> str:
+	return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def _get_connection() -> sqlite3.Connection:
+	global _CONN
+	if _CONN is None:
+		cache_dir = _cache_dir()
+		cache_dir.mkdir(parents=True, exist_ok=True)
+		db_path = cache_dir / "responses.sqlite3"
+		_CONN = sqlite3.connect(str(db_path), check_same_thread=False)
+		_CONN.execute(
+			"CREATE TABLE IF NOT EXISTS responses ("
+			"key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+		)
+		_CONN.commit()
+		logger.info(f"Response cache opened at {db_path}")
+	return _CONN
+
+
+def get(key: str) -> Optional[str]:
+	if not _reads_enabled():
+		return None
+	try:
+		with _LOCK:
+			row = _get_connection().execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+	except (sqlite3.Error, OSError) as e:
+		logger.error(f"Failed to read response cache: {e}")
+		return None
+	return row[0] if row else None
+
+
+def put(key: str, value: str) -> None:
+	try:
+		with _LOCK:
+			conn = _get_connection()
+			conn.execute(
+				"INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+				(key, value, time.time()),
+			)
+			conn.commit()
+	except (sqlite3.Error, OSError) as e:
+		logger.error(f"Failed to write response cache: {e}")
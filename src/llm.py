@@ -1,24 +1,41 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import importlib.util
+import io
 import logging
 import os
+import re
+import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
 
+import orjson
 from dotenv import load_dotenv
-from openai import OpenAI
-import pypdf
+
+from . import cache
+
+if TYPE_CHECKING:
+	import httpx
+	from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
-load_dotenv(Path(__file__).resolve().parent.parent / ".env")
+# openai and pypdf are imported on first use. .env also carries throttling and cache settings,
+# so it is always read; variables already exported take precedence
+load_dotenv(Path(__file__).resolve().parent.parent / ".env", override=False)
 
 _MODEL_NAME = os.getenv("OPENAI_MODEL", "gpt-5")
-_FILENAME_MODEL = os.getenv("OPENAI_FILENAME_MODEL", "gpt-5")
 _MAX_TOKENS = int(os.getenv("OPENAI_MAX_TOKENS", "1200"))
 _FILENAME_MAX_TOKENS = int(os.getenv("OPENAI_FILENAME_MAX_TOKENS", "60"))
 _TEMPERATURE = float(os.getenv("OPENAI_TEMPERATURE", "0.3"))
 _TOP_P = float(os.getenv("OPENAI_TOP_P", "0.95"))
+# Proactive throttling; 0 disables a limit. 429s that still happen are retried by the SDK with backoff
+_REQUESTS_PER_MINUTE = float(os.getenv("OPENAI_RPM", "0"))
+_TOKENS_PER_MINUTE = float(os.getenv("OPENAI_TPM", "0"))
+_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "6"))
 
 # Default prompts
 _DEFAULT_COVER_LETTER_PROMPT = (
@@ -42,36 +59,230 @@ _DEFAULT_FILENAME_PROMPT = (
 _COVER_LETTER_PROMPT = _DEFAULT_COVER_LETTER_PROMPT
 _FILENAME_PROMPT = _DEFAULT_FILENAME_PROMPT
 
+# Fixed wrappers around each user-supplied prompt section
+_RESUME_OPEN = "<resume>\n"
+_RESUME_CLOSE = "\n</resume>"
+_SAMPLE_OPEN = "<cover_letter_sample>\n"
+_SAMPLE_CLOSE = (
+	"\n</cover_letter_sample>\n\n"
+	"Use the cover letter sample only as a stylistic reference; do not copy it."
+)
+_JOB_DESCRIPTION_OPEN = "<job_description>\n"
+_JOB_DESCRIPTION_CLOSE = "\n</job_description>"
+# Task instructions trail the inputs so every request type shares the same input prefix
+_COVER_LETTER_TASK = "Draft the complete cover letter now."
+
+# Structured output used when the filename is requested alongside the letter
+# The user's filename prompt is written for a standalone call, so it is fenced off as rules for the
+# "filename" value only; its "output only the filename" line must not override the JSON format
+_FILENAME_TASK_PREFIX = (
+	"Also name the PDF for this cover letter. Respond with JSON: put the complete cover letter in "
+	"\"letter\" and the filename in \"filename\". The guidelines below apply only to the value of "
+	"\"filename\" (no extension); they do not change the JSON response format.\n<filename_guidelines>\n"
+)
+_FILENAME_TASK_SUFFIX = "\n</filename_guidelines>"
+_LETTER_AND_FILENAME_FORMAT = {
+	"type": "json_schema",
+	"name": "cover_letter_with_filename",
+	"strict": True,
+	"schema": {
+		"type": "object",
+		"properties": {
+			"letter": {"type": "string"},
+			"filename": {"type": "string"},
+		},
+		"required": ["letter", "filename"],
+		"additionalProperties": False,
+	},
+}
+
+# Per-section prompt budgets, estimated at ~4 characters per token
+_CHARS_PER_TOKEN = 4
+_RESUME_TOKEN_BUDGET = int(os.getenv("COVER_LETTER_RESUME_TOKENS", "4000"))
+_SAMPLE_TOKEN_BUDGET = int(os.getenv("COVER_LETTER_SAMPLE_TOKENS", "2000"))
+_JOB_DESCRIPTION_TOKEN_BUDGET = int(os.getenv("COVER_LETTER_JOB_DESCRIPTION_TOKENS", "2000"))
+_EXCESS_BLANK_LINES = re.compile(r"\n[ \t]*(?:\n[ \t]*){2,}")
+
+# Any run of characters outside [a-z0-9] collapses to a single underscore
+_NON_FILENAME_CHARS = re.compile(r"[^a-z0-9]+")
+_FILENAME_MAX_LENGTH = 40
+_FILENAME_CONTEXT_CHARS = 1000
+
+# Local company/role extraction, tried before asking the filename model
+# Dots only count inside a word ("Booking.com"), so a name stops at the end of its sentence
+_COMPANY_WORD = r"[A-Z](?:[A-Za-z0-9&'\-]|\.(?=[A-Za-z0-9]))*"
+_COMPANY_NAME = rf"{_COMPANY_WORD}(?:[ \t]+{_COMPANY_WORD}){{0,3}}"
+_COMPANY_LABEL = re.compile(rf"(?i:company|employer|organization)[ \t]*:[ \t]*({_COMPANY_NAME})")
+# "at" only counts straight after a role ("Software Engineer at Shopify"); on its own it also
+# matches places and job boards ("apply at LinkedIn", "our office at Toronto")
+_ROLE_AT_COMPANY = re.compile(rf"[ \t]*,?[ \t]+(?i:at)[ \t]+({_COMPANY_NAME})")
+_COMPANY_INTRO = re.compile(rf"(?i:\bjoin|\bjoining|\babout)[ \t]+({_COMPANY_NAME})")
+_COMPANY_STOPWORDS = frozenset(
+	{
+		"a", "an", "the", "our", "us", "we", "this", "your", "you", "my", "job", "role", "position", "team",
+		# Job boards and applicant tracking systems named in postings
+		"linkedin", "indeed", "glassdoor", "ziprecruiter", "monster", "workday", "greenhouse", "lever",
+		"handshake", "wellfound",
+	}
+)
+_ROLE_PATTERN = re.compile(
+	r"\b(software (?:engineer|developer)|(?:front|back)[- ]?end (?:engineer|developer)|full[- ]?stack (?:engineer|developer)"
+	r"|data (?:scientist|engineer|analyst)|machine learning engineer|ml engineer|devops engineer"
+	r"|site reliability engineer|security engineer|qa engineer|test engineer|mobile (?:engineer|developer)"
+	r"|product (?:manager|designer|owner)|project manager|program manager|engineering manager"
+	r"|ux designer|ui designer|ux researcher|business analyst|solutions architect|consultant|accountant)\b",
+	re.IGNORECASE,
+)
+
+_PDF_READ_BUFFER = 1 << 20
+_PDF_TEXT_NAMESPACE = "pdf_text"
+# Bump when extraction changes in a way the cache key below doesn't already capture
+_PDF_TEXT_VERSION = 1
+# Plain (non-layout) extraction of upright text only; rotated runs are usually decoration
+_PDF_EXTRACT_OPTIONS = {"extraction_mode": "plain", "orientations": (0,)}
+# Oversized inputs are cut before they reach the prompt; the model's context is the real limit
+_MAX_INPUT_CHARS = int(os.getenv("COVER_LETTER_MAX_INPUT_CHARS", "100000"))
+
 # Models that support temperature and top_p
 _MODELS_WITH_SAMPLING = {"gpt-5.1"}
 
-_CLIENT: Optional[OpenAI] = None
+_CLIENT: Optional[AsyncOpenAI] = None
+# Shared connection pool; survives client resets when the API key changes
+_HTTP_CLIENT: Optional[httpx.AsyncClient] = None
 
 
-def _build_prompt(resume_text: str, job_description: str, sample_text: Optional[str]) -> str:
-	sample_section = ""
+@functools.lru_cache(maxsize=32)
+def _format_user_content(resume_text: str, job_description: str, sample_text: Optional[str]) -> Tuple[str, ...]:
+	parts = ["".join((_RESUME_OPEN, _fit_to_budget(resume_text, _RESUME_TOKEN_BUDGET), _RESUME_CLOSE))]
 	if sample_text:
-		sample_section = (
-			"<cover_letter_sample>\n"
-			f"{sample_text.strip()}\n"
-			"</cover_letter_sample>\n\n"
-			"Use the cover letter sample only as a stylistic reference; do not copy it.\n\n"
+		parts.append("".join((_SAMPLE_OPEN, _fit_to_budget(sample_text, _SAMPLE_TOKEN_BUDGET), _SAMPLE_CLOSE)))
+	parts.append(
+		"".join(
+			(
+				_JOB_DESCRIPTION_OPEN,
+				_fit_to_budget(job_description, _JOB_DESCRIPTION_TOKEN_BUDGET),
+				_JOB_DESCRIPTION_CLOSE,
+			)
 		)
-
-	return (
-		_COVER_LETTER_PROMPT + "\n\n"
-		"<resume>\n"
-		f"{resume_text.strip()}\n"
-		"</resume>\n\n"
-		+ sample_section
-		+ "<job_description>\n"
-		+ f"{job_description.strip()}\n"
-		+ "</job_description>\n\n"
-		+ "Draft the complete cover letter now."
 	)
+	return tuple(parts)
+
+
+def _fit_to_budget(text: str, max_tokens: int) -> str:
+	# PDF extraction leaves runs of blank lines that each cost tokens
+	text = _EXCESS_BLANK_LINES.sub("\n\n", text.strip())
+	max_chars = max_tokens * _CHARS_PER_TOKEN
+	if len(text) <= max_chars:
+		return text
+	truncated = text[:max_chars]
+	# Prefer ending on a line or sentence boundary if one is reasonably close
+	boundary = max(truncated.rfind("\n"), truncated.rfind(". "))
+	if boundary >= max_chars * 0.8:
+		truncated = truncated[: boundary + 1]
+	logger.warning(f"Truncated prompt section from {len(text)} to {len(truncated)} characters (~{max_tokens} tokens)")
+	return truncated.rstrip()
+
+
+def _build_messages(resume_text: str, job_description: str, sample_text: Optional[str]) -> List[Dict[str, Any]]:
+	# Static content first, volatile job description last, so repeat runs share a cacheable prefix.
+	# Each section is its own typed part, giving the server clean boundaries between them.
+	return [
+		{"role": "system", "content": _COVER_LETTER_PROMPT},
+		{
+			"role": "user",
+			"content": [
+				{"type": "input_text", "text": text}
+				for text in (*_format_user_content(resume_text, job_description, sample_text), _COVER_LETTER_TASK)
+			],
+		},
+	]
+
+
+def _sanitize_filename(raw: str) -> str:
+	sanitized = _NON_FILENAME_CHARS.sub("_", raw.lower()).strip("_")
+	return sanitized[:_FILENAME_MAX_LENGTH].rstrip("_")
+
+
+@functools.lru_cache(maxsize=64)
+def _guess_filename(job_excerpt: str) -> Optional[str]:
+	role_matches = list(_ROLE_PATTERN.finditer(job_excerpt))
+	if not role_matches:
+		return None
+	first_role = role_matches[0].group(1)
+	# Most explicit source first: a "Company:" label, then "<role> at <Company>", then "Join <Company>"
+	candidates = [(match, first_role) for match in _COMPANY_LABEL.finditer(job_excerpt)]
+	for role_match in role_matches:
+		match = _ROLE_AT_COMPANY.match(job_excerpt, role_match.end())
+		if match:
+			candidates.append((match, role_match.group(1)))
+	candidates.extend((match, first_role) for match in _COMPANY_INTRO.finditer(job_excerpt))
+
+	for match, role in candidates:
+		company = match.group(1).strip(" .-'")
+		if company and company.split()[0].lower() not in _COMPANY_STOPWORDS:
+			return _sanitize_filename(f"{company}_{role}") or None
+	return None
+
 
+class _TokenBucket:
+	def __init__(self, per_minute: float) -> None:
+		self._capacity = per_minute
+		self._rate = per_minute / 60.0
+		self._tokens = per_minute
+		self._updated = time.monotonic()
+		self._lock: Optional[asyncio.Lock] = None
 
-def _get_client() -> OpenAI:
+	async def acquire(self, amount: float = 1.0) -> None:
+		if self._capacity <= 0:
+			return
+		amount = min(amount, self._capacity)
+		if self._lock is None:
+			self._lock = asyncio.Lock()
+		async with self._lock:
+			while True:
+				now = time.monotonic()
+				self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+				self._updated = now
+				if self._tokens >= amount:
+					self._tokens -= amount
+					return
+				wait = (amount - self._tokens) / self._rate
+				logger.info(f"Rate limit reached, waiting {wait:.1f}s before calling OpenAI")
+				await asyncio.sleep(wait)
+
+
+_REQUEST_BUCKET = _TokenBucket(_REQUESTS_PER_MINUTE)
+_TOKEN_BUCKET = _TokenBucket(_TOKENS_PER_MINUTE)
+
+
+async def _throttle(messages: List[Dict[str, Any]], max_output_tokens: int) -> None:
+	# Estimated input tokens plus the full output allowance
+	input_chars = 0
+	for message in messages:
+		content = message["content"]
+		if isinstance(content, str):
+			input_chars += len(content)
+		else:
+			input_chars += sum(len(part["text"]) for part in content)
+	estimated_tokens = input_chars // _CHARS_PER_TOKEN + max_output_tokens
+	await _REQUEST_BUCKET.acquire()
+	await _TOKEN_BUCKET.acquire(estimated_tokens)
+
+
+def _get_http_client() -> httpx.AsyncClient:
+	global _HTTP_CLIENT
+	if _HTTP_CLIENT is None:
+		import httpx
+
+		_HTTP_CLIENT = httpx.AsyncClient(
+			http2=True,
+			limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+			timeout=httpx.Timeout(600.0, connect=5.0),
+		)
+	return _HTTP_CLIENT
+
+
+def _get_client() -> AsyncOpenAI:
 	global _CLIENT
 	if _CLIENT is None:
 		api_key = os.getenv("OPENAI_API_KEY")
@@ -80,7 +291,9 @@ def _get_client() -> OpenAI:
 			logger.error(error_msg)
 			raise RuntimeError(error_msg)
 		try:
-			_CLIENT = OpenAI(api_key=api_key)
+			from openai import AsyncOpenAI
+
+			_CLIENT = AsyncOpenAI(api_key=api_key, http_client=_get_http_client(), max_retries=_MAX_RETRIES)
 			logger.info("OpenAI client initialized successfully")
 		except Exception as e:
 			logger.error(f"Failed to initialize OpenAI client: {e}", exc_info=True)
@@ -90,102 +303,290 @@ def _get_client() -> OpenAI:
 
 def _extract_text_from_file(file_path: str) -> str:
 	try:
-		path = Path(file_path)
-		if path.suffix.lower() == ".pdf":
-			reader = pypdf.PdfReader(str(path))
-			text_parts = []
-			for page in reader.pages:
-				text_parts.append(page.extract_text() or "")
-			logger.info(f"Extracted text from PDF: {file_path}")
-			return "\n".join(text_parts)
-		else:
-			text = path.read_text(encoding="utf-8", errors="ignore")
-			logger.info(f"Extracted text from file: {file_path}")
-			return text
+		path = Path(file_path).resolve()
+		st = path.stat()
+		return _extract_text_cached(str(path), st.st_mtime_ns, st.st_size)
 	except Exception as e:
 		logger.error(f"Failed to extract text from file {file_path}: {e}", exc_info=True)
 		raise
 
 
-def generate_cover_letter(
+@functools.lru_cache(maxsize=16)
+def _extract_text_cached(file_path: str, mtime_ns: int, size: int) -> str:
+	# PDF parsing is the slow path, so its text is also kept on disk across runs
+	path = Path(file_path)
+	if path.suffix.lower() != ".pdf":
+		return _read_file_text(path)
+
+	# Everything that shapes the extracted text is in the key, so installing pypdfium2 or
+	# raising COVER_LETTER_MAX_INPUT_CHARS doesn't keep serving text from the old settings
+	key_parts = (
+		file_path,
+		mtime_ns,
+		size,
+		_PDF_TEXT_VERSION,
+		_pdf_backend(),
+		sorted(_PDF_EXTRACT_OPTIONS.items()),
+		_MAX_INPUT_CHARS,
+	)
+	key = hashlib.sha1(repr(key_parts).encode("utf-8")).hexdigest()
+	text = cache.read_text(_PDF_TEXT_NAMESPACE, key)
+	if text is not None:
+		logger.info(f"Loaded cached PDF text: {file_path}")
+		return text
+	text = _read_file_text(path)
+	cache.write_text(_PDF_TEXT_NAMESPACE, key, text)
+	return text
+
+
+def _pdf_backend() -> str:
+	# pypdfium2 is optional; pypdf is the fallback
+	return "pypdfium2" if importlib.util.find_spec("pypdfium2") is not None else "pypdf"
+
+
+def _read_file_text(path: Path) -> str:
+	if path.suffix.lower() == ".pdf":
+		if _pdf_backend() == "pypdfium2":
+			import pypdfium2
+
+			text = _read_pdf_text_pdfium(pypdfium2, path)
+		else:
+			text = _read_pdf_text_pypdf(path)
+		logger.info(f"Extracted text from PDF: {path}")
+	else:
+		text = path.read_text(encoding="utf-8", errors="ignore")
+		logger.info(f"Extracted text from file: {path}")
+
+	if len(text) > _MAX_INPUT_CHARS:
+		logger.warning(f"Truncating {path} from {len(text)} to {_MAX_INPUT_CHARS} characters")
+		text = text[:_MAX_INPUT_CHARS]
+	return text
+
+
+def _read_pdf_text_pdfium(pdfium: Any, path: Path) -> str:
+	# PDFium is native and much faster than pypdf, but not thread-safe, so pages are read in order
+	buffer = io.StringIO()
+	pdf = pdfium.PdfDocument(str(path))
+	try:
+		for page in pdf:
+			textpage = page.get_textpage()
+			_write_page_text(buffer, textpage.get_text_range().replace("\r\n", "\n"))
+			textpage.close()
+			page.close()
+	finally:
+		pdf.close()
+	return buffer.getvalue()
+
+
+def _read_pdf_text_pypdf(path: Path) -> str:
+	import pypdf
+
+	# Page text streams into one buffer instead of a list joined at the end. pypdf is pure Python
+	# and GIL-bound, so pages are read inline; worker threads only added re-parsing overhead
+	buffer = io.StringIO()
+	with open(path, "rb", buffering=_PDF_READ_BUFFER) as fh:
+		reader = pypdf.PdfReader(fh, strict=False)
+		for page in reader.pages:
+			_write_page_text(buffer, page.extract_text(**_PDF_EXTRACT_OPTIONS))
+	return buffer.getvalue()
+
+
+def _write_page_text(buffer: io.StringIO, page_text: Optional[str]) -> None:
+	if page_text:
+		buffer.write(page_text)
+		buffer.write("\n")
+
+
+async def _load_inputs(resume_path: str, sample_path: Optional[str]) -> Tuple[str, Optional[str]]:
+	# Parse the resume and sample concurrently off the event loop
+	loop = asyncio.get_running_loop()
+	sample_text = None
+	if sample_path:
+		resume_text, sample_text = await asyncio.gather(
+			loop.run_in_executor(None, _extract_text_from_file, resume_path),
+			loop.run_in_executor(None, _extract_text_from_file, sample_path),
+		)
+		logger.info("Sample cover letter loaded")
+	else:
+		resume_text = await loop.run_in_executor(None, _extract_text_from_file, resume_path)
+	logger.debug(f"Resume text sample: {resume_text[:2000]}")
+	return resume_text, sample_text
+
+
+def _cover_letter_cache_key(
+	kind: str, resume_text: str, job_description: str, sample_text: Optional[str], *extra: str
+) -> str:
+	return cache.make_key(
+		kind,
+		*extra,
+		_MODEL_NAME,
+		str(_MAX_TOKENS),
+		str(_TEMPERATURE),
+		str(_TOP_P),
+		_COVER_LETTER_PROMPT,
+		resume_text,
+		job_description,
+		sample_text or "",
+	)
+
+
+@functools.lru_cache(maxsize=8)
+def _base_request(model: str, max_tokens: int, temperature: float, top_p: float) -> Dict:
+	# Build request params - only include temperature/top_p for supported models
+	request_params = {
+		"model": model,
+		"max_output_tokens": max_tokens,
+	}
+
+	if model in _MODELS_WITH_SAMPLING:
+		request_params["temperature"] = temperature
+		request_params["top_p"] = top_p
+	return request_params
+
+
+def _incomplete_reason(response: Any) -> str:
+	details = response.incomplete_details
+	return details.reason if details and details.reason else "unknown reason"
+
+
+def _cover_letter_request(messages: List[Dict[str, Any]], max_tokens: int) -> Dict:
+	# The cached base is shared, so always hand callers a fresh copy
+	return {**_base_request(_MODEL_NAME, max_tokens, _TEMPERATURE, _TOP_P), "input": messages}
+
+
+async def generate_cover_letter(
 	resume_path: str,
 	job_description: str,
 	sample_path: Optional[str] = None,
-) -> str:
+	use_cache: bool = True,
+) -> AsyncIterator[str]:
 	try:
-		resume_text = _extract_text_from_file(resume_path)
-		logger.debug(f"Resume text sample: {resume_text[:2000]}")
-		sample_text = None
-		if sample_path:
-			sample_text = _extract_text_from_file(sample_path)
-			logger.info("Sample cover letter loaded")
-
-		prompt = _build_prompt(resume_text, job_description, sample_text)
-		client = _get_client()
+		resume_text, sample_text = await _load_inputs(resume_path, sample_path)
 
-		# Build request params - only include temperature/top_p for supported models
-		request_params = {
-			"model": _MODEL_NAME,
-			"max_output_tokens": _MAX_TOKENS,
-			"input": [
-				{
-					"role": "system",
-					"content": "You craft concise, personalized cover letters.",
-				},
-				{
-					"role": "user",
-					"content": prompt,
-				},
-			],
-		}
+		cache_key = _cover_letter_cache_key("cover_letter", resume_text, job_description, sample_text)
+		cached = cache.get(cache_key) if use_cache else None
+		if cached is not None:
+			logger.info("Cover letter served from cache")
+			yield cached
+			return
 
-		if _MODEL_NAME in _MODELS_WITH_SAMPLING:
-			request_params["temperature"] = _TEMPERATURE
-			request_params["top_p"] = _TOP_P
+		messages = _build_messages(resume_text, job_description, sample_text)
+		client = _get_client()
+		request_params = _cover_letter_request(messages, _MAX_TOKENS)
 
+		await _throttle(messages, _MAX_TOKENS)
 		logger.info(f"Calling OpenAI API with model {_MODEL_NAME}")
-		response = client.responses.create(**request_params)
-		logger.info("Cover letter generated successfully")
+		stream = await client.responses.create(**request_params, stream=True)
+		parts: List[str] = []
+		completed = False
+		# The SDK doesn't raise for failures reported inside the stream, so check the terminal event.
+		# The context manager closes the HTTP stream on errors and cancellation, not just at the end
+		async with stream:
+			async for event in stream:
+				if event.type == "response.output_text.delta":
+					parts.append(event.delta)
+					yield event.delta
+				elif event.type == "response.completed":
+					completed = True
+				elif event.type == "response.incomplete":
+					logger.warning(
+						f"Cover letter stopped early ({_incomplete_reason(event.response)}); it will not be cached"
+					)
+				elif event.type == "response.failed":
+					error = event.response.error
+					raise RuntimeError(f"OpenAI response failed: {error.message if error else 'unknown error'}")
+				elif event.type == "error":
+					raise RuntimeError(f"OpenAI stream error: {event.message}")
 
-		return response.output_text.strip()
+		cover_letter = "".join(parts).strip()
+		if completed:
+			logger.info("Cover letter generated successfully")
+			if cover_letter:
+				cache.put(cache_key, cover_letter)
 	except Exception as e:
 		logger.error(f"Failed to generate cover letter: {e}", exc_info=True)
 		raise
 
 
-def generate_filename(job_description: str) -> str:
-    logger.info("Generating dynamic filename")
-    try:
-        client = _get_client()
-        logger.info(f"Calling API with model {_FILENAME_MODEL}")
-        response = client.responses.create(
-            model=_FILENAME_MODEL,
-            max_output_tokens=_FILENAME_MAX_TOKENS,
-            input=[
-                {
-                    "role": "system",
-                    "content": _FILENAME_PROMPT,
-                },
-                {
-                    "role": "user",
-                    "content": f"Generate a filename for a cover letter for this job:\n\n{job_description[:1000]}",
-                },
-            ],
-        )
-        logger.info("API response received")
-        raw = response.output_text.strip().lower()
-        logger.debug(f"Raw filename from API: '{raw}'")
-
-        if not raw:
-            logger.warning("Empty response from filename API, using default")
-            return "cover_letter"
-
-        sanitized = "".join(c if c.isalnum() or c == "_" else "_" for c in raw)
-        sanitized = "_".join(part for part in sanitized.split("_") if part)  # collapse multiple underscores
-        final_filename = sanitized[:40] or "cover_letter"
-        logger.info(f"Generated filename: '{final_filename}'")
-        return final_filename
-    except Exception as e:
-        logger.error(f"Filename generation failed: {e}", exc_info=True)
-        logger.info("Using default filename")
-        return "cover_letter"
+async def generate_cover_letter_and_filename(
+	resume_path: str,
+	job_description: str,
+	sample_path: Optional[str] = None,
+	use_cache: bool = True,
+) -> Tuple[str, str]:
+	try:
+		resume_text, sample_text = await _load_inputs(resume_path, sample_path)
+
+		# The filename settings are part of the key, so editing them in Preferences takes effect
+		cache_key = _cover_letter_cache_key(
+			"cover_letter_and_filename",
+			resume_text,
+			job_description,
+			sample_text,
+			_FILENAME_PROMPT,
+			str(_FILENAME_MAX_TOKENS),
+		)
+		cached = cache.get(cache_key) if use_cache else None
+		if cached is not None:
+			logger.info("Cover letter and filename served from cache")
+			data = orjson.loads(cached)
+			# Entries cached before the letter and filename had their own keys still seed them
+			_cache_batched_parts(resume_text, job_description, sample_text, data["letter"], data["filename"])
+			return data["letter"], data["filename"]
+
+		# Same prefix as the streaming request, with the filename task appended at the end
+		messages = _build_messages(resume_text, job_description, sample_text)
+		messages.append({"role": "user", "content": f"{_FILENAME_TASK_PREFIX}{_FILENAME_PROMPT}{_FILENAME_TASK_SUFFIX}"})
+		client = _get_client()
+		request_params = _cover_letter_request(messages, _MAX_TOKENS + _FILENAME_MAX_TOKENS)
+		request_params["text"] = {"format": _LETTER_AND_FILENAME_FORMAT}
+
+		await _throttle(messages, request_params["max_output_tokens"])
+		logger.info(f"Calling OpenAI API with model {_MODEL_NAME} for cover letter and filename")
+		response = await client.responses.create(**request_params)
+		if response.status == "incomplete":
+			raise RuntimeError(f"Cover letter stopped early ({_incomplete_reason(response)})")
+		if response.status == "failed":
+			error = response.error
+			raise RuntimeError(f"OpenAI response failed: {error.message if error else 'unknown error'}")
+		data = orjson.loads(response.output_text)
+		cover_letter = data["letter"].strip()
+		filename = _sanitize_filename(data["filename"]) or "cover_letter"
+		logger.info(f"Cover letter generated successfully with filename '{filename}'")
+
+		if cover_letter:
+			cache.put(cache_key, orjson.dumps({"letter": cover_letter, "filename": filename}).decode("utf-8"))
+		_cache_batched_parts(resume_text, job_description, sample_text, cover_letter, filename)
+		return cover_letter, filename
+	except Exception as e:
+		logger.error(f"Failed to generate cover letter and filename: {e}", exc_info=True)
+		raise
+
+
+def _cache_batched_parts(
+	resume_text: str, job_description: str, sample_text: Optional[str], cover_letter: str, filename: str
+) -> None:
+	# Once a posting has a name, later pastes take the streaming path, so it must find this letter too
+	if cover_letter:
+		cache.put(_cover_letter_cache_key("cover_letter", resume_text, job_description, sample_text), cover_letter)
+	# Keyed by the job description alone, so lookup_filename finds it with a different resume or sample
+	cache.put(_filename_cache_key(job_description), filename)
+
+
+def lookup_filename(job_description: str) -> Optional[str]:
+    # Filename from the cache or local heuristics, without a network call
+    cached = cache.get(_filename_cache_key(job_description))
+    if cached is not None:
+        logger.info(f"Filename served from cache: '{cached}'")
+        return cached
+
+    guessed = _guess_filename(job_description[:_FILENAME_CONTEXT_CHARS])
+    if guessed:
+        logger.info(f"Filename extracted locally: '{guessed}'")
+    return guessed
+
+
+def _filename_cache_key(job_description: str) -> str:
+    return cache.make_key(
+        "filename", _MODEL_NAME, _FILENAME_PROMPT, job_description[:_FILENAME_CONTEXT_CHARS]
+    )
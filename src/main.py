@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
+import hashlib
+import io
 import logging
 import os
 import re
 import subprocess
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
 
 logging.basicConfig(
     level=logging.INFO,
@@ -22,12 +27,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-from reportlab.lib.pagesizes import LETTER
-from reportlab.lib.utils import simpleSplit
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.pdfgen import canvas
-from tkfontchooser import families
+import orjson
 
 from . import llm
 
@@ -38,17 +38,18 @@ SETTINGS_PATH = PROJECT_ROOT / ".cover_letter_settings.json"
 ENV_PATH = PROJECT_ROOT / ".env"
 PDF_FILENAME = os.getenv("COVER_LETTER_OUTPUT", "cover_letter.pdf")
 MARGIN = 72  # 1 inch
+LINK_COLOR = "#0000cc"
+STATE_WRITE_DELAY_MS = 250
+MAX_CLIPBOARD_CHARS = 200_000  # Job postings are far shorter; anything bigger was copied by mistake
 FONT_EXTENSIONS = (".ttf", ".otf", ".ttc")
 
 # Available models
 COVER_LETTER_MODELS = ["gpt-5.1", "gpt-5", "gpt-5-mini", "gpt-5-nano"]
-FILENAME_MODELS = ["gpt-5.1", "gpt-5", "gpt-5-mini", "gpt-5-nano"]
 # Models that support temperature and top_p
 MODELS_WITH_SAMPLING = {"gpt-5.1"}
 
 DEFAULT_SETTINGS = {
     "cover_letter_model": "gpt-5.1",
-    "filename_model": "gpt-5.1",
     "max_tokens": 1200,
     "filename_max_tokens": 60,
     "temperature": 0.3,
@@ -76,8 +77,68 @@ DEFAULT_SETTINGS = {
 }
 
 # Regex patterns for detecting linkable content
-EMAIL_PATTERN = re.compile(r'[\w.+-]+@[\w.-]+\.\w+')
-URL_PATTERN = re.compile(r'\b(?<!@)(?:https?://)?(?:www\.)?[\w.-]+\.(?:com|ca|org)\b(?:/[\w./-]*)?')
+# ASCII mode: links are ASCII in practice, and \w/\b skip the Unicode property lookups
+EMAIL_PATTERN = re.compile(r'[\w.+-]+@[\w.-]+\.\w+', re.ASCII)
+URL_PATTERN = re.compile(r'\b(?<!@)(?:https?://)?(?:www\.)?[\w.-]+\.(?:com|ca|org)\b(?:/[\w./-]*)?', re.ASCII)
+# Single-pass scan; emails are tried first at each position so URLs never overlap them
+LINK_PATTERN = re.compile(rf'(?P<email>{EMAIL_PATTERN.pattern})|(?P<url>{URL_PATTERN.pattern})', re.ASCII)
+
+# Leading spaces, and runs of two or more, that Paragraph would otherwise collapse
+SPACE_RUN_PATTERN = re.compile(r'^ +| {2,}')
+
+# The API key line in .env
+ENV_API_KEY_PATTERN = re.compile(r'^OPENAI_API_KEY=.*$', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=1)
+def _available_fonts() -> frozenset[str]:
+    # Enumerating system fonts is slow on macOS, so do it once per session
+    from tkfontchooser import families
+
+    return frozenset(name.replace("\\ ", " ") for name in families())
+
+
+def _preserve_spaces(match: re.Match[str]) -> str:
+    run = match.group()
+    if match.start() == 0:
+        return "\xa0" * len(run)
+    # Keep one ordinary space at the end so the line can still wrap there
+    return "\xa0" * (len(run) - 1) + " "
+
+
+# Per-directory {lowercased stem: font file}, rebuilt only when the directory's mtime changes
+_FONT_DIR_INDEXES: Dict[Path, Tuple[int, Dict[str, Path]]] = {}
+
+
+def _font_dir_index(directory: Path) -> Dict[str, Path]:
+    try:
+        mtime_ns = directory.stat().st_mtime_ns
+    except OSError:
+        return {}
+    cached = _FONT_DIR_INDEXES.get(directory)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
+    # One directory listing replaces a stat() per stem/extension candidate
+    ranked: Dict[str, Tuple[int, Path]] = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                ext = ext.lower()
+                if ext not in FONT_EXTENSIONS:
+                    continue
+                rank = FONT_EXTENSIONS.index(ext)
+                key = stem.lower()
+                # Keep the FONT_EXTENSIONS preference when a family ships several formats
+                if key not in ranked or rank < ranked[key][0]:
+                    ranked[key] = (rank, Path(entry.path))
+    except OSError as e:
+        logger.warning(f"Failed to list font directory {directory}: {e}")
+        return {}
+    index = {key: path for key, (_, path) in ranked.items()}
+    _FONT_DIR_INDEXES[directory] = (mtime_ns, index)
+    return index
 
 
 class FileUploadApp(tk.Tk):
@@ -90,13 +151,25 @@ class FileUploadApp(tk.Tk):
 
         self._ensure_env_file()
 
+        # Long-lived event loop so the async OpenAI client keeps one loop for its connections
+        self._loop = asyncio.new_event_loop()
+        # Blocking work (file reads, text extraction) reuses these threads across pastes
+        self._loop.set_default_executor(ThreadPoolExecutor(max_workers=2, thread_name_prefix="llm"))
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
         self.selected_files: Dict[str, Optional[str]] = {"resume": None, "sample": None}
         self.display_vars: Dict[str, tk.StringVar] = {
             slot: tk.StringVar(value="No file selected") for slot in self.selected_files
         }
         self._generation_in_progress = False
-        self._font_path: Optional[Path] = None
-        self._current_job_description: Optional[str] = None
+        self._font_paths: Dict[str, Path] = {}
+        # Font names already handed to reportlab, so repeat saves skip its registry lookup
+        self._registered_fonts: set[str] = set()
+        self._filename_base: Optional[str] = None
+        # Filenames already produced this session, keyed by a digest of the job description.
+        # Across restarts llm.lookup_filename finds them in the response cache instead.
+        self._filename_cache: Dict[str, str] = {}
+        self._persist_after_id: Optional[str] = None
         self._settings: Dict = DEFAULT_SETTINGS.copy()
 
         self._load_settings()
@@ -105,6 +178,9 @@ class FileUploadApp(tk.Tk):
         self._build_widgets()
         self._bind_paste_shortcuts()
         self._load_previous_files()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        if sys.platform.startswith("darwin"):
+            self.createcommand("tk::mac::Quit", self._on_close)
 
     def _ensure_env_file(self) -> None:
         if not ENV_PATH.exists():
@@ -120,7 +196,7 @@ class FileUploadApp(tk.Tk):
         file_menu.add_command(label="Open Resume", command=lambda: self._select_file("resume"))
         file_menu.add_command(label="Open Sample (Optional)", command=lambda: self._select_file("sample"))
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.quit)
+        file_menu.add_command(label="Exit", command=self._on_close)
 
         # Edit menu
         edit_menu = tk.Menu(menubar, tearoff=0)
@@ -146,18 +222,18 @@ class FileUploadApp(tk.Tk):
         if not SETTINGS_PATH.exists():
             return
         try:
-            data = json.loads(SETTINGS_PATH.read_text())
+            data = orjson.loads(SETTINGS_PATH.read_bytes())
             for key in DEFAULT_SETTINGS:
                 if key in data:
                     self._settings[key] = data[key]
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse settings JSON: {e}")
         except OSError as e:
             logger.error(f"Failed to read settings file: {e}")
 
     def _save_settings(self) -> None:
         try:
-            SETTINGS_PATH.write_text(json.dumps(self._settings, indent=2))
+            SETTINGS_PATH.write_bytes(orjson.dumps(self._settings, option=orjson.OPT_INDENT_2))
         except OSError as e:
             logger.error(f"Failed to save settings: {e}")
 
@@ -190,14 +266,6 @@ class FileUploadApp(tk.Tk):
         cover_model_menu.grid(row=row, column=1, sticky="w", pady=5)
         row += 1
 
-        # Filename Model
-        tk.Label(main_frame, text="Filename Model:", anchor="w").grid(row=row, column=0, sticky="w", pady=5)
-        filename_model_var = tk.StringVar(value=self._settings["filename_model"])
-        filename_model_menu = tk.OptionMenu(main_frame, filename_model_var, *FILENAME_MODELS)
-        filename_model_menu.config(width=15)
-        filename_model_menu.grid(row=row, column=1, sticky="w", pady=5)
-        row += 1
-
         # Max Tokens
         tk.Label(main_frame, text="Max Tokens:", anchor="w").grid(row=row, column=0, sticky="w", pady=5)
         max_tokens_var = tk.StringVar(value=str(self._settings["max_tokens"]))
@@ -255,7 +323,7 @@ class FileUploadApp(tk.Tk):
         # Font Selection
         tk.Label(main_frame, text="Font:", anchor="w").grid(row=row, column=0, sticky="w", pady=5)
         font_var = tk.StringVar(value=self._settings["font_name"])
-        available_fonts = sorted(set(name.replace("\\ ", " ") for name in families()))
+        available_fonts = sorted(_available_fonts())
         font_menu = tk.OptionMenu(main_frame, font_var, *available_fonts)
         font_menu.config(width=20)
         font_menu.grid(row=row, column=1, sticky="w", pady=5)
@@ -287,7 +355,6 @@ class FileUploadApp(tk.Tk):
             # Reset all UI variables to default values
             api_key_var.set("")
             cover_model_var.set(DEFAULT_SETTINGS["cover_letter_model"])
-            filename_model_var.set(DEFAULT_SETTINGS["filename_model"])
             max_tokens_var.set(str(DEFAULT_SETTINGS["max_tokens"]))
             filename_max_tokens_var.set(str(DEFAULT_SETTINGS["filename_max_tokens"]))
             temperature_var.set(str(DEFAULT_SETTINGS["temperature"]))
@@ -323,7 +390,6 @@ class FileUploadApp(tk.Tk):
 
             # Update settings
             self._settings["cover_letter_model"] = cover_model_var.get()
-            self._settings["filename_model"] = filename_model_var.get()
             self._settings["max_tokens"] = max_tokens
             self._settings["filename_max_tokens"] = filename_max_tokens
             self._settings["temperature"] = temperature
@@ -334,9 +400,6 @@ class FileUploadApp(tk.Tk):
             self._settings["cover_letter_prompt"] = cover_letter_prompt_text.get("1.0", tk.END).strip()
             self._settings["filename_prompt"] = filename_prompt_text.get("1.0", tk.END).strip()
 
-            # Reset font path cache when font changes
-            self._font_path = None
-
             self._save_settings()
 
             # Update llm module with new settings
@@ -361,21 +424,16 @@ class FileUploadApp(tk.Tk):
             if ENV_PATH.exists():
                 env_content = ENV_PATH.read_text()
 
-            # Check if OPENAI_API_KEY exists in the file
-            lines = env_content.splitlines()
-            key_found = False
-            new_lines = []
-            for line in lines:
-                if line.startswith("OPENAI_API_KEY="):
-                    new_lines.append(f"OPENAI_API_KEY={api_key}")
-                    key_found = True
-                else:
-                    new_lines.append(line)
+            # Replace the key in place, leaving the rest of the file (and its final newline) untouched.
+            # A callable replacement keeps backslashes in the key from being read as escapes.
+            key_line = f"OPENAI_API_KEY={api_key}"
+            env_content, replaced = ENV_API_KEY_PATTERN.subn(lambda _: key_line, env_content, count=1)
+            if not replaced:
+                if env_content and not env_content.endswith("\n"):
+                    env_content += "\n"
+                env_content += f"{key_line}\n"
 
-            if not key_found:
-                new_lines.append(f"OPENAI_API_KEY={api_key}")
-
-            ENV_PATH.write_text("\n".join(new_lines))
+            ENV_PATH.write_text(env_content)
 
             # Update environment variable in current process
             os.environ["OPENAI_API_KEY"] = api_key
@@ -388,7 +446,6 @@ class FileUploadApp(tk.Tk):
 
     def _apply_llm_settings(self) -> None:
         llm._MODEL_NAME = self._settings["cover_letter_model"]
-        llm._FILENAME_MODEL = self._settings["filename_model"]
         llm._MAX_TOKENS = self._settings["max_tokens"]
         llm._FILENAME_MAX_TOKENS = self._settings["filename_max_tokens"]
         llm._TEMPERATURE = self._settings["temperature"]
@@ -443,8 +500,11 @@ class FileUploadApp(tk.Tk):
     def _bind_paste_shortcuts(self) -> None:
         for sequence in ("<<Paste>>", "<Command-v>", "<Control-v>"):
             self.bind_all(sequence, self._handle_paste_event)
+        # Shift+paste regenerates instead of reusing a cached letter for the same inputs
+        for sequence in ("<Command-V>", "<Control-V>"):
+            self.bind_all(sequence, lambda event: self._handle_paste_event(event, use_cache=False))
 
-    def _handle_paste_event(self, event: tk.Event) -> str | None:
+    def _handle_paste_event(self, event: tk.Event, use_cache: bool = True) -> str | None:
         if self._generation_in_progress:
             self.status_var.set("Already generating a cover letter...")
             return "break"
@@ -460,6 +520,12 @@ class FileUploadApp(tk.Tk):
             self.status_var.set("Clipboard does not contain text.")
             return "break"
 
+        # Checked before strip() and logging so an oversized paste isn't copied around further
+        if len(job_description) > MAX_CLIPBOARD_CHARS:
+            logger.warning(f"Ignoring clipboard of {len(job_description)} characters")
+            self.status_var.set("Clipboard too large; paste a job description.")
+            return "break"
+
         if not job_description.strip():
             self.status_var.set("Clipboard was empty.")
             return "break"
@@ -469,31 +535,60 @@ class FileUploadApp(tk.Tk):
         logger.debug("[DEBUG] --- End Job Description Text ---")
 
         self._generation_in_progress = True
-        self._current_job_description = job_description
-        self.status_var.set("Generating cover letter...")
-        threading.Thread(
-            target=self._generate_cover_letter,
-            args=(resume_path, job_description, self.selected_files.get("sample")),
-            daemon=True,
-        ).start()
+        self._filename_base = None
+        self.status_var.set("Generating cover letter..." if use_cache else "Regenerating cover letter...")
+        asyncio.run_coroutine_threadsafe(
+            self._generate_cover_letter(
+                resume_path, job_description, self.selected_files.get("sample"), use_cache
+            ),
+            self._loop,
+        )
         return "break"
 
-    def _generate_cover_letter(
+    async def _generate_cover_letter(
         self,
         resume_path: str,
         job_description: str,
         sample_path: Optional[str] = None,
+        use_cache: bool = True,
     ) -> None:
         try:
-            cover_letter = llm.generate_cover_letter(resume_path, job_description, sample_path)
+            job_key = hashlib.blake2b(job_description.encode("utf-8"), digest_size=16).hexdigest()
+            filename_base = self._filename_cache.get(job_key) or llm.lookup_filename(job_description)
+            if filename_base:
+                cover_letter = await self._stream_cover_letter(
+                    resume_path, job_description, sample_path, use_cache
+                )
+            else:
+                # No cached or locally derived name, so fold the filename into the letter request
+                cover_letter, filename_base = await llm.generate_cover_letter_and_filename(
+                    resume_path, job_description, sample_path, use_cache
+                )
+            self._filename_cache[job_key] = filename_base
         except Exception as exc:  # noqa: BLE001 - surfaced to UI
             self.after(0, lambda err=exc: self._on_generation_failed(err))
             return
 
-        self.after(0, lambda: self._on_generation_succeeded(cover_letter))
+        self.after(0, lambda: self._on_generation_succeeded(cover_letter, filename_base))
 
-    def _on_generation_succeeded(self, cover_letter: str) -> None:
+    async def _stream_cover_letter(
+        self,
+        resume_path: str,
+        job_description: str,
+        sample_path: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> str:
+        parts: List[str] = []
+        length = 0
+        async for chunk in llm.generate_cover_letter(resume_path, job_description, sample_path, use_cache):
+            parts.append(chunk)
+            length += len(chunk)
+            self.after(0, self.status_var.set, f"Writing cover letter... ({length} characters)")
+        return "".join(parts).strip()
+
+    def _on_generation_succeeded(self, cover_letter: str, filename_base: str) -> None:
         self._generation_in_progress = False
+        self._filename_base = filename_base
         logger.info("Generated cover letter successfully")
         logger.debug(f"Cover Letter Content:\n{cover_letter}")
         try:
@@ -513,6 +608,11 @@ class FileUploadApp(tk.Tk):
         self.status_var.set(f"Generation failed: {error}")
 
     def _save_cover_letter_pdf(self, cover_letter: str) -> Path:
+        # reportlab is only needed once a letter exists, so keep it off the startup path
+        from reportlab.lib.pagesizes import LETTER
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate, Paragraph, Spacer
+
         self._register_font()
         filename = self._get_dynamic_filename()
         output_dir = Path(self._settings["output_path"])
@@ -521,112 +621,87 @@ class FileUploadApp(tk.Tk):
         pdf_path = output_dir / filename
         font_name = self._settings["font_name"]
         font_size = self._settings["font_size"]
-        c = canvas.Canvas(str(pdf_path), pagesize=LETTER)
-        max_width = LETTER[0] - (2 * MARGIN)
-        current_y = LETTER[1] - MARGIN
+        # Links are underlined by the style, so each link only carries its colour in markup
+        style = ParagraphStyle(
+            "CoverLetter", fontName=font_name, fontSize=font_size, leading=font_size + 2, linkUnderline=1
+        )
 
-        for paragraph in cover_letter.splitlines():
+        # Platypus handles wrapping, page breaks and link annotations in a single layout pass
+        story = []
+        # Stream lines out of the letter rather than building a list of them first
+        for line in io.StringIO(cover_letter):
+            paragraph = line.rstrip("\r\n")
             if not paragraph.strip():
-                current_y -= font_size + 2
-                if current_y <= MARGIN:
-                    c.showPage()
-                    current_y = LETTER[1] - MARGIN
+                story.append(Spacer(1, font_size + 2))
                 continue
-
-            for line in simpleSplit(paragraph, font_name, font_size, max_width):
-                if current_y <= MARGIN:
-                    c.showPage()
-                    current_y = LETTER[1] - MARGIN
-                current_y = self._draw_line_with_links(c, line, MARGIN, current_y, font_name, font_size)
-
-        c.save()
+            story.append(Paragraph(self._paragraph_markup(paragraph), style))
+
+        doc = BaseDocTemplate(
+            str(pdf_path),
+            pagesize=LETTER,
+            leftMargin=MARGIN,
+            rightMargin=MARGIN,
+            topMargin=MARGIN,
+            bottomMargin=MARGIN,
+        )
+        # Unpadded frame so text starts exactly at MARGIN (SimpleDocTemplate's frame adds 6pt)
+        frame = Frame(
+            doc.leftMargin,
+            doc.bottomMargin,
+            doc.width,
+            doc.height,
+            leftPadding=0,
+            rightPadding=0,
+            topPadding=0,
+            bottomPadding=0,
+        )
+        doc.addPageTemplates([PageTemplate(id="CoverLetter", frames=[frame])])
+        doc.build(story)
         return pdf_path
 
-    def _find_links_in_text(self, text: str) -> List[Tuple[int, int, str, str]]:
-        links = []
-
-        # Track positions that are part of emails (to exclude from URL matching)
-        email_positions: set[int] = set()
-
-        # Find emails first
-        for match in EMAIL_PATTERN.finditer(text):
-            email = match.group()
-            links.append((match.start(), match.end(), email, f"mailto:{email}"))
-            # Mark all positions in this email as used
-            for i in range(match.start(), match.end()):
-                email_positions.add(i)
-
-        # Find URLs, but skip any that overlap with emails
-        for match in URL_PATTERN.finditer(text):
-            # Skip if any part of this match overlaps with an email
-            if any(i in email_positions for i in range(match.start(), match.end())):
-                continue
-            url_text = match.group()
-            url = url_text if url_text.startswith(('http://', 'https://')) else f"https://{url_text}"
-            links.append((match.start(), match.end(), url_text, url))
-
-        # Sort by position
-        links.sort(key=lambda x: x[0])
-        return links
-
-    def _draw_line_with_links(
-        self, c: canvas.Canvas, line: str, x: float, y: float,
-        font_name: str, font_size: int
-    ) -> float:
-        links = self._find_links_in_text(line)
-
-        if not links:
-            # No links, just draw the text normally
-            c.setFont(font_name, font_size)
-            c.drawString(x, y, line)
-            return y - (font_size + 2)
-
-        # Draw text segments with links
-        current_x = x
+    def _paragraph_markup(self, text: str) -> str:
+        # Paragraph collapses whitespace, so keep indentation and repeated spaces as non-breaking spaces
+        text = SPACE_RUN_PATTERN.sub(_preserve_spaces, text)
+        parts = []
         last_end = 0
-
-        for start, end, display_text, url in links:
-            # Draw text before the link
-            if start > last_end:
-                before_text = line[last_end:start]
-                c.setFont(font_name, font_size)
-                c.drawString(current_x, y, before_text)
-                current_x += pdfmetrics.stringWidth(before_text, font_name, font_size)
-
-            # Draw the link (blue and underlined)
-            c.setFillColorRGB(0, 0, 0.8)  # Blue color
-            c.setFont(font_name, font_size)
-            link_width = pdfmetrics.stringWidth(display_text, font_name, font_size)
-            c.drawString(current_x, y, display_text)
-
-            # Add the clickable link annotation
-            c.linkURL(url, (current_x, y - 2, current_x + link_width, y + font_size), relative=0)
-
-            # Draw underline
-            c.setStrokeColorRGB(0, 0, 0.8)
-            c.line(current_x, y - 1, current_x + link_width, y - 1)
-
-            current_x += link_width
-            c.setFillColorRGB(0, 0, 0)  # Reset to black
-            c.setStrokeColorRGB(0, 0, 0)
+        for start, end, display_text, url in self._find_links_in_text(text):
+            parts.append(escape(text[last_end:start]))
+            parts.append(f'<a href="{escape(url)}" color="{LINK_COLOR}">{escape(display_text)}</a>')
             last_end = end
+        parts.append(escape(text[last_end:]))
+        return "".join(parts)
 
-        # Draw remaining text after last link
-        if last_end < len(line):
-            remaining_text = line[last_end:]
-            c.setFont(font_name, font_size)
-            c.drawString(current_x, y, remaining_text)
-
-        return y - (font_size + 2)
+    def _find_links_in_text(self, text: str) -> List[Tuple[int, int, str, str]]:
+        # Both emails and URLs need a dot, so most body lines can skip the regex entirely
+        if "." not in text:
+            return []
+        links = []
+        # finditer yields non-overlapping matches in order, so no overlap check or sort is needed
+        for match in LINK_PATTERN.finditer(text):
+            link_text = match.group()
+            if match.lastgroup == "email":
+                links.append((match.start(), match.end(), link_text, f"mailto:{link_text}"))
+            else:
+                url = link_text if link_text.startswith(('http://', 'https://')) else f"https://{link_text}"
+                links.append((match.start(), match.end(), link_text, url))
+        return links
 
     def _register_font(self) -> None:
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+
         try:
             font_name = self._settings["font_name"]
+            if font_name in self._registered_fonts:
+                return
             if font_name in pdfmetrics.getRegisteredFontNames():
+                self._registered_fonts.add(font_name)
                 return
-            if self._font_path is None:
-                self._font_path = self._resolve_font_path()
-            pdfmetrics.registerFont(TTFont(font_name, str(self._font_path)))
+            font_path = self._font_paths.get(font_name)
+            if font_path is None:
+                font_path = self._font_paths[font_name] = self._resolve_font_path()
+            pdfmetrics.registerFont(TTFont(font_name, str(font_path)))
+            self._registered_fonts.add(font_name)
             logger.info(f"Font '{font_name}' registered successfully")
         except Exception as e:
             logger.error(f"Failed to register font: {e}", exc_info=True)
@@ -634,8 +709,10 @@ class FileUploadApp(tk.Tk):
 
     def _resolve_font_path(self) -> Path:
         font_name = self._settings["font_name"]
-        available_fonts = {name.replace("\\ ", " ") for name in families()}
-        if font_name not in available_fonts:
+        if font_name not in _available_fonts():
+            # The font may have been installed since the list was cached
+            _available_fonts.cache_clear()
+        if font_name not in _available_fonts():
             error_msg = f"System font '{font_name}' not found. Ensure it is installed or choose another font."
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
@@ -657,35 +734,41 @@ class FileUploadApp(tk.Tk):
         ]
 
         if sys.platform.startswith("darwin"):
-            for stem in file_stems:
-                for ext in FONT_EXTENSIONS:
-                    found = self._mdfind_font(f"{stem}{ext}")
-                    if found:
-                        return found
+            found = self._mdfind_font([f"{stem}{ext}" for stem in file_stems for ext in FONT_EXTENSIONS])
+            if found:
+                return found
 
+        lowered_stems = [stem.lower() for stem in file_stems]
         for directory in self._font_search_dirs():
-            for stem in file_stems:
-                for ext in FONT_EXTENSIONS:
-                    candidate = directory / f"{stem}{ext}"
-                    if candidate.exists():
-                        return candidate
+            index = _font_dir_index(directory)
+            for stem in lowered_stems:
+                if stem in index:
+                    return index[stem]
         return None
 
-    def _mdfind_font(self, filename: str) -> Optional[Path]:
+    def _mdfind_font(self, filenames: List[str]) -> Optional[Path]:
         if not sys.platform.startswith("darwin"):
             return None
-        query = f'kMDItemKind == "Font" && kMDItemDisplayName == "{filename}"'
+        # One Spotlight query for every candidate name instead of one mdfind process per name
+        names = " || ".join(f'kMDItemDisplayName == "{filename}"' for filename in filenames)
+        query = f'kMDItemKind == "Font" && ({names})'
         try:
             result = subprocess.run(
-                ["mdfind", query], capture_output=True, text=True, check=False
+                ["mdfind", query], capture_output=True, check=False
             )
         except FileNotFoundError as e:
             logger.warning(f"mdfind command not found: {e}")
             return None
-        for line in result.stdout.splitlines():
+
+        found: Dict[str, Path] = {}
+        for line in result.stdout.decode("utf-8", errors="replace").splitlines():
             path = Path(line.strip())
-            if path.exists():
-                return path
+            if path.name not in found and path.exists():
+                found[path.name] = path
+        # Honour the caller's preference order rather than Spotlight's result order
+        for filename in filenames:
+            if filename in found:
+                return found[filename]
         return None
 
     def _font_search_dirs(self) -> list[Path]:
@@ -704,8 +787,8 @@ class FileUploadApp(tk.Tk):
         if not STATE_PATH.exists():
             return
         try:
-            data = json.loads(STATE_PATH.read_text())
-        except json.JSONDecodeError as e:
+            data = orjson.loads(STATE_PATH.read_bytes())
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse state JSON: {e}")
             return
         except OSError as e:
@@ -735,23 +818,32 @@ class FileUploadApp(tk.Tk):
             self.status_var.set("Cmd+V the job description (using previous resume)")
 
     def _persist_state(self) -> None:
+        # Coalesce back-to-back selections into one write
+        if self._persist_after_id is not None:
+            self.after_cancel(self._persist_after_id)
+        self._persist_after_id = self.after(STATE_WRITE_DELAY_MS, self._flush_state)
+
+    def _flush_state(self) -> None:
+        self._persist_after_id = None
+        tmp_path = STATE_PATH.with_name(f"{STATE_PATH.name}.tmp")
         try:
-            STATE_PATH.write_text(json.dumps(self.selected_files))
+            tmp_path.write_bytes(orjson.dumps(self.selected_files))
+            os.replace(tmp_path, STATE_PATH)
         except OSError as e:
             logger.error(f"Failed to persist state: {e}")
 
+    def _on_close(self) -> None:
+        if self._persist_after_id is not None:
+            self.after_cancel(self._persist_after_id)
+            self._flush_state()
+        self.destroy()
+
     def _get_dynamic_filename(self) -> str:
-        if not self._current_job_description:
-            logger.info("No job description stored, using default filename")
-            return PDF_FILENAME
-        try:
-            logger.info("Generating dynamic filename...")
-            base = llm.generate_filename(self._current_job_description)
-            logger.info(f"Generated filename base: {base}")
-            return f"{base}.pdf"
-        except Exception as e:  # noqa: BLE001
-            logger.error(f"Filename generation failed: {e}", exc_info=True)
+        if not self._filename_base:
+            logger.info("No generated filename available, using default filename")
             return PDF_FILENAME
+        logger.info(f"Generated filename base: {self._filename_base}")
+        return f"{self._filename_base}.pdf"
 
     def _show_result_dialog(self, pdf_path: Path) -> None:
         dialog = tk.Toplevel(self)
@@ -794,7 +886,8 @@ class FileUploadApp(tk.Tk):
     def _open_file(self, pdf_path: Path) -> None:
         try:
             if sys.platform.startswith("darwin"):
-                subprocess.run(["open", str(pdf_path)], check=False)
+                if not self._open_with_workspace(pdf_path):
+                    subprocess.run(["open", str(pdf_path)], check=False)
             elif os.name == "nt":
                 os.startfile(str(pdf_path))  # type: ignore[attr-defined]
             else:
@@ -807,7 +900,8 @@ class FileUploadApp(tk.Tk):
     def _open_directory(self, directory: Path) -> None:
         try:
             if sys.platform.startswith("darwin"):
-                subprocess.run(["open", str(directory)], check=False)
+                if not self._open_with_workspace(directory):
+                    subprocess.run(["open", str(directory)], check=False)
             elif os.name == "nt":
                 os.startfile(str(directory))  # type: ignore[attr-defined]
             else:
@@ -817,6 +911,14 @@ class FileUploadApp(tk.Tk):
             logger.error(f"Unable to open directory {directory}: {exc}", exc_info=True)
             messagebox.showerror("Unable to open directory", str(exc))
 
+    def _open_with_workspace(self, path: Path) -> bool:
+        # Launch Services opens the path in-process instead of forking this interpreter for `open`
+        try:
+            from AppKit import NSURL, NSWorkspace
+        except ImportError:
+            return False
+        return bool(NSWorkspace.sharedWorkspace().openURL_(NSURL.fileURLWithPath_(str(path))))
+
 
 def main() -> None:
     app = FileUploadApp()
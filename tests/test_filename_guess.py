@@ -0,0 +1,46 @@
+import unittest
+
+from src import llm
+
+
+class GuessFilenameTests(unittest.TestCase):
+    def guess(self, text: str):
+        llm._guess_filename.cache_clear()
+        return llm._guess_filename(text)
+
+    def test_role_at_company(self):
+        self.assertEqual(self.guess("Software Engineer at Shopify\nRemote"), "shopify_software_engineer")
+        self.assertEqual(self.guess("Software Engineer, at Shopify"), "shopify_software_engineer")
+
+    def test_company_label(self):
+        self.assertEqual(self.guess("Company: Acme Corp\nRole: Data Scientist"), "acme_corp_data_scientist")
+
+    def test_join_company(self):
+        self.assertEqual(self.guess("Join Stripe as a backend engineer"), "stripe_backend_engineer")
+
+    def test_name_stops_at_sentence_end(self):
+        self.assertEqual(
+            self.guess("Software Engineer at Stripe. We are looking for builders."), "stripe_software_engineer"
+        )
+        self.assertEqual(self.guess("Data Scientist at Airbnb. You will own models."), "airbnb_data_scientist")
+        self.assertEqual(
+            self.guess("Software Engineer at Google. About Google: we organize information."),
+            "google_software_engineer",
+        )
+
+    def test_dotted_company_name(self):
+        self.assertEqual(self.guess("Product Manager at Booking.com. Apply today."), "booking_com_product_manager")
+
+    def test_at_without_role_is_ignored(self):
+        self.assertIsNone(self.guess("We need a software engineer. Apply at LinkedIn or Indeed."))
+        self.assertIsNone(self.guess("Our office at Toronto is hiring a product manager"))
+
+    def test_job_boards_are_not_companies(self):
+        self.assertIsNone(self.guess("Find this data analyst role on LinkedIn. Join LinkedIn today"))
+
+    def test_requires_role(self):
+        self.assertIsNone(self.guess("Company: Acme Corp"))
+
+
+if __name__ == "__main__":
+    unittest.main()